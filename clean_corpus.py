@@ -1,75 +1,132 @@
+import mmap
+import os
 import re
+import string
+
+# Chunk size for streaming the corpus (1 MiB)
+CHUNK_SIZE = 1 << 20
+
+# The corpus is filtered as UTF-8 bytes and only the kept text is decoded.
+# ASCII bytes never occur inside a multi-byte UTF-8 sequence, so English
+# letters, digits and math symbols can be deleted with bytes.translate;
+# commas become spaces so words can later be split on whitespace alone,
+# and '!' and '?' become full stops, as they end sentences too.
+# This runs after _MARKUP_RE: deleting letters first would join the '-'
+# and '=' of text like 'state-of-the-art' or 'x=1=' into header markers.
+_PUNCT_TABLE = bytes.maketrans(b',!?', b' ..')
+_ASCII_NOISE = (string.ascii_letters + string.digits + '+*/()').encode('ascii')
+
+# The danda and double danda (U+0964, U+0965) end sentences in Indic text;
+# they become full stops before _KEEP_RE drops the rest of their block
+_DANDA_RE = re.compile(rb'\xe0\xa5[\xa4\xa5]')
+
+# Markup is removed in one pass: custom headers and Wikipedia section
+# headers, wiki links (replaced by their inner text), templates and tags.
+# The template replacement keeps the whole substitution in C; alternatives
+# other than a wiki link leave 'wl' unmatched, which expands to ''.
+# Every alternative starts with a literal character, so the regex engine
+# builds a first-character set and skips ahead to the next '-', '=', '[',
+# '{' or '<' instead of attempting a match at every position.
+# No alternative can match across a newline: an unclosed '---', '==' or
+# '<' then only scans to the end of its line, not to the end of the chunk,
+# which would make many unclosed openers quadratic in the chunk size.
+_MARKUP_RE = re.compile(
+    rb'---.*?---'
+    rb'|==.*?=='
+    rb'|\[\[(?P<wl>.*?)\]\]'
+    rb'|\{\{.*?\}\}'
+    rb'|<[^>\n]*>'
+)
+_MARKUP_REPL = rb'\g<wl>'
+
+# Runs of what is kept: Telugu letters (U+0C00-U+0C7F, encoded as
+# E0 B0 80 - E0 B1 BF), full stops, ASCII whitespace (bytes \s plus the
+# separators U+001C-U+001F that str \s also matches) and the encodings of
+# the non-ASCII Unicode spaces. Everything else, including Devanagari, is
+# dropped by joining the runs.
+_KEEP_RE = re.compile(
+    rb'(?:\xe0[\xb0\xb1][\x80-\xbf]|[\s\x1c-\x1f.]'
+    rb'|\xc2[\x85\xa0]|\xe1\x9a\x80|\xe2\x80[\x80-\x8a\xa8\xa9\xaf]'
+    rb'|\xe2\x81\x9f|\xe3\x80\x80)+'
+)
+
+
+def read_chunks(file, chunk_size=CHUNK_SIZE):
+    """
+    Yields the binary file in chunks of roughly chunk_size bytes.
+    The file is memory-mapped, so pages are read in by the OS as the scan
+    reaches them and each chunk is copied out of the mapping exactly once.
+    Each chunk ends at a line break: no _MARKUP_RE match spans lines, so
+    markup is never split across two chunks (nor is a UTF-8 sequence).
+    """
+    if os.fstat(file.fileno()).st_size == 0:
+        return
+    with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        start, size = 0, len(mm)
+        while start < size:
+            end = start + chunk_size
+            if end >= size:
+                cut = size
+            else:
+                # Cut at the last line break in the window; a line longer
+                # than the window is kept whole
+                cut = mm.rfind(b'\n', start + 1, end)
+                if cut == -1:
+                    cut = mm.find(b'\n', end)
+                    if cut == -1:
+                        cut = size
+            yield mm[start:cut]
+            start = cut
+
+
+def clean_chunk(data):
+    """Applies the bulk cleaning steps to one chunk of raw UTF-8 bytes."""
+    data = _MARKUP_RE.sub(_MARKUP_REPL, data)
+    data = _DANDA_RE.sub(b'.', data)
+    data = data.translate(_PUNCT_TABLE, _ASCII_NOISE)
+    return b''.join(_KEEP_RE.findall(data)).decode('utf-8')
+
+
+def iter_sentences(chunks):
+    """
+    Cleans each chunk and yields its sentences as lists of Telugu words.
+    Single letters are dropped. A sentence that is not finished at the end
+    of a chunk carries over into the next one.
+    """
+    words = []
+    for chunk in chunks:
+        # Cleaned text is only Telugu words, whitespace and full stops,
+        # so plain str.split is enough to find sentences and words
+        *sentences, tail = clean_chunk(chunk).split('.')
+        for sentence in sentences:
+            words += [w for w in sentence.split() if len(w) > 1]
+            # Only a full stop that follows a word ends a sentence
+            if words:
+                yield words
+                words = []
+        words += [w for w in tail.split() if len(w) > 1]
+    if words:
+        yield words
+
 
 def clean_telugu_text(input_filepath, output_filepath):
     """
     Cleans a text file by removing headers, wiki markup, other noise,
-    consecutive full stops, very short sentences (1-2 words), and single letters.
+    consecutive full stops, single letters, and very short sentences
+    (1-2 words once single letters are gone).
+    The input is streamed chunk by chunk instead of being loaded whole.
     """
     try:
-        # Step 1: Read the entire content of the file
-        with open(input_filepath, "r", encoding="utf-8") as file:
-            text = file.read()
-        
-        print("Starting bulk data cleaning process...")
-
-        # Step 2: Remove custom headers and Wikipedia section headers
-        text = re.sub(r'---.*?---|==.*?==', '', text, flags=re.DOTALL)
-        
-        # Step 3: Remove common Wikipedia markup and HTML tags
-        text = re.sub(r'\[\[(.*?)\]\]', r'\1', text) 
-        text = re.sub(r'\{\{(.*?)\}\}', '', text)    
-        text = re.sub(r'<[^>]*>', '', text)          
-
-        # Step 4: Remove English words, Hindi words, numbers, and mathematical symbols
-        text = re.sub(r'[a-zA-Z]+', '', text, flags=re.UNICODE)
-        text = re.sub(r'[\u0900-\u097F]+', '', text, flags=re.UNICODE)  # Hindi
-        text = re.sub(r'[0-9+\-*/=()]+', '', text, flags=re.UNICODE)
-        
-        # Step 5: Keep only Telugu characters and basic punctuation.
-        cleaned_text = re.sub(r'[^\u0C00-\u0C7F\s\.,]', '', text, flags=re.UNICODE)
-        
-        # Step 6: Normalize whitespace
-        cleaned_text = re.sub(r'\s+', ' ', cleaned_text).strip()
-
-        print("Bulk cleaning complete. Starting line-by-line filtering...")
-        
-        # Step 7: Filter out unwanted lines
-        # Split the text into sentences
-        lines = cleaned_text.split('.')
-        
-        # Regex for junk lines (e.g., "కె.", ",.", or just ".")
-        junk_line_pattern = re.compile(r'^\s*([\u0C00-\u0C7F]{1,2}\s*[,\.]?\s*|\s*,\s*\.\s*|\s*\.\s*)$', flags=re.UNICODE)
-        
-        filtered_lines = []
-        for line in lines:
-            line = line.strip()
-            
-            # Skip empty lines or junk lines
-            if not line or junk_line_pattern.match(line):
-                continue
-            
-            # Find Telugu words in the sentence
-            words = re.findall(r'[\u0C00-\u0C7F]+', line)
-            
-            # Skip sentences with <= 2 Telugu words
-            if len(words) <= 2:
-                continue
-            
-            # Remove single letters (standalone Telugu characters) in the sentence
-            line = ' '.join([w for w in words if len(w) > 1])
-            
-            if line:  # only keep non-empty sentences
-                filtered_lines.append(line)
-        
-        # Join the filtered lines with a full stop and a newline
-        final_text = '.\n'.join(filtered_lines) + '.'
-
-        # Remove consecutive full stops (if any)
-        final_text = re.sub(r'\.{2,}', '.', final_text)
-
-        # Save the cleaned text to a new file
-        with open(output_filepath, "w", encoding="utf-8") as file:
-            file.write(final_text)
+        print("Starting streaming data cleaning process...")
+
+        # Each kept sentence is written out as soon as it is produced
+        with open(input_filepath, "rb") as file, \
+                open(output_filepath, "w", encoding="utf-8") as out:
+            for words in iter_sentences(read_chunks(file)):
+                # Skip sentences with <= 2 Telugu words
+                if len(words) > 2:
+                    out.write(' '.join(words))
+                    out.write('.\n')
 
         print(f"Data cleaning complete. Cleaned data saved to '{output_filepath}'.")
 
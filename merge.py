@@ -1,85 +1,172 @@
+import heapq
 import json
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from hashlib import blake2b
+from itertools import chain, groupby
+
+
+# Whitespace and commas between the elements of a JSON array
+_SEPARATOR_RE = re.compile(r'[\s,]*')
+
+
+def read_lines(files):
+    """Yield the stripped, non-empty lines of each file in turn"""
+    for file in files:
+        with open(file, "r", encoding="utf-8") as f:
+            # strip and the emptiness check run in C, off the per-line
+            # Python path that feeds the dedup tables
+            yield from filter(None, map(str.strip, f))
+
+
+def read_sorted_lines(file):
+    """Yield the lines of an already sorted file, checking that it is sorted"""
+    previous = ''
+    for line in read_lines([file]):
+        if line < previous:
+            raise ValueError(f"{file} is not sorted ('{line}' after '{previous}')")
+        previous = line
+        yield line
+
+
+def dedup_to_file(files, output_file):
+    """
+    Write the unique lines of files to output_file in first-occurrence order.
+    Only an 8-byte fingerprint of each line is kept in memory instead of the
+    line itself; two different lines are merged only on a 64-bit hash
+    collision (odds of a few in a million for 10 million lines).
+    Returns the number of lines written.
+    """
+    seen = set()
+    with open(output_file, "w", encoding="utf-8") as out:
+        for line in read_lines(files):
+            key = blake2b(line.encode("utf-8"), digest_size=8).digest()
+            if key not in seen:
+                seen.add(key)
+                out.write(line + "\n")
+    return len(seen)
+
+
+def merge_sorted_files(files, output_file):
+    """
+    Write the union of already sorted files to output_file, still sorted.
+    A k-way merge brings duplicates next to each other, so they are dropped
+    while streaming without holding the lines in memory or sorting again.
+    The merge is written to a temporary file that replaces output_file only
+    once it is complete, so an unsorted input leaves the previous output in
+    place instead of a truncated one.
+    Returns the number of lines written.
+    """
+    count = 0
+    temp_file = output_file + ".tmp"
+    try:
+        with open(temp_file, "w", encoding="utf-8") as out:
+            merged = heapq.merge(*(read_sorted_lines(file) for file in files))
+            for line, _ in groupby(merged):
+                out.write(line + "\n")
+                count += 1
+    except BaseException:
+        os.remove(temp_file)
+        raise
+    os.replace(temp_file, output_file)
+    return count
+
+
+def iter_json_array(file, chunk_size=1 << 20):
+    """
+    Yield the elements of the top-level JSON array in file one at a time.
+    The file is read in chunks and each element is decoded as soon as it is
+    complete, so the whole array is never parsed into one list.
+    """
+    decoder = json.JSONDecoder()
+    with open(file, "r", encoding="utf-8") as f:
+        buffer = f.read(chunk_size).lstrip()
+        if not buffer.startswith('['):
+            raise ValueError(f"{file} does not contain a JSON array")
+        pos = 1
+        while True:
+            pos = _SEPARATOR_RE.match(buffer, pos).end()
+            if buffer.startswith(']', pos):
+                return
+            try:
+                element, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                # The element continues in the next chunk
+                block = f.read(chunk_size)
+                if not block:
+                    raise
+                buffer = buffer[pos:] + block
+                pos = 0
+                continue
+            yield element
+            pos = end
+
+
+def dedup_json_files(files, output_file):
+    """
+    Write the unique tokenized sentences of files to output_file as a JSON
+    array, keeping first-occurrence order. Sentences are streamed from the
+    inputs to the output; token lists become tuples so they can be kept in
+    the set of sentences already written.
+    Tokens are interned: the vocabulary is small compared to the number of
+    sentences, so every occurrence of a word in the set shares one string
+    and key comparisons take the identity fast path.
+    Returns the number of sentences written.
+    """
+    intern = sys.intern
+    seen = set()
+    with open(output_file, "w", encoding="utf-8") as out:
+        out.write('[')
+        for tokens in chain.from_iterable(iter_json_array(file) for file in files):
+            key = tuple(map(intern, tokens))
+            if key in seen:
+                continue
+            if seen:
+                out.write(', ')
+            seen.add(key)
+            out.write(json.dumps(tokens, ensure_ascii=False))
+        out.write(']')
+
+    return len(seen)
+
 
 # ------------------------------
 #  Merge and deduplicate sentence files
 # ------------------------------
 sent_files = ["telugu_sentences_1.txt", "telugu_sentences_2.txt"]
-sentences = set()  # to remove duplicates
-
-for file in sent_files:
-    with open(file, "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if line:
-                sentences.add(line)
-
-# Convert to list (sorted for consistency)
-unique_sentences = sorted(sentences)
-
-with open("telugu_sentences.txt", "w", encoding="utf-8") as f:
-    for s in unique_sentences:
-        f.write(s + "\n")
-
-print(f" Unique sentences: {len(unique_sentences):,} → telugu_sentences.txt")
 
 # ------------------------------
 # Merge and deduplicate vocabulary files
+# (the tokenization scripts write their vocabularies sorted)
 # ------------------------------
 voc_files = ["telugu_vocabulary_1.txt", "telugu_vocabulary_2.txt"]
-vocabulary = set()
-
-for file in voc_files:
-    with open(file, "r", encoding="utf-8") as f:
-        for line in f:
-            word = line.strip()
-            if word:
-                vocabulary.add(word)
-
-# Save sorted vocabulary
-with open("telugu_vocabulary.txt", "w", encoding="utf-8") as f:
-    for word in sorted(vocabulary):
-        f.write(word + "\n")
-
-print(f"Unique vocabulary: {len(vocabulary):,} → telugu_vocabulary.txt")
 
 # ------------------------------
 # Merge and deduplicate cleaned data files
 # ------------------------------
-
 cleaned_files = ["final_cleaned_telugu_data_1.txt", "final_cleaned_telugu_data_2.txt"]
-cleaned = set()
-
-for file in cleaned_files:
-    with open(file, "r", encoding="utf-8") as f:
-        for line in f:
-            word = line.strip()
-            if word:
-                cleaned.add(word)
-
-# Save sorted vocabulary
-with open("final_cleaned_telugu_data.txt", "w", encoding="utf-8") as f:
-    for word in sorted(cleaned):
-        f.write(word + "\n")
-
-print(f"Total sentences: {len(cleaned):,} → final_cleaned_telugu_data.txt")
 
 # ------------------------------
 #  Merge and deduplicate tokenized JSON files
 # ------------------------------
 tok_files = ["telugu_tokenized_sentences_1.json", "telugu_tokenized_sentences_2.json"]
-tokens_seen = set()
-unique_tokenized_sentences = []
 
-for file in tok_files:
-    with open(file, "r", encoding="utf-8") as f:
-        data = json.load(f)
-        for tok_list in data:
-            tok_tuple = tuple(tok_list)  # convert list to tuple for hashing
-            if tok_tuple not in tokens_seen:
-                tokens_seen.add(tok_tuple)
-                unique_tokenized_sentences.append(tok_list)
+MERGES = [
+    (" Unique sentences", dedup_to_file, sent_files, "telugu_sentences.txt"),
+    ("Unique vocabulary", merge_sorted_files, voc_files, "telugu_vocabulary.txt"),
+    ("Total sentences", dedup_to_file, cleaned_files, "final_cleaned_telugu_data.txt"),
+    ("Unique tokenized sentences", dedup_json_files, tok_files, "telugu_tokenized_sentences.json"),
+]
+
 
-with open("telugu_tokenized_sentences.json", "w", encoding="utf-8") as f:
-    json.dump(unique_tokenized_sentences, f, ensure_ascii=False, indent=None)
+if __name__ == "__main__":
+    # The merges read and write disjoint files, so each one runs in its own
+    # process; results are reported in the usual order
+    with ProcessPoolExecutor(max_workers=len(MERGES)) as executor:
+        futures = [executor.submit(merge, files, output_file)
+                   for _, merge, files, output_file in MERGES]
 
-print(f"Unique tokenized sentences: {len(unique_tokenized_sentences):,} → telugu_tokenized_sentences.json")
\ No newline at end of file
+        for (label, _, _, output_file), future in zip(MERGES, futures):
+            print(f"{label}: {future.result():,} → {output_file}")
@@ -1,11 +1,127 @@
 import re
+import os
+import sys
+import gc
+import gzip
 import json
 import pickle
 import math
+import heapq
+import multiprocessing
+import unicodedata
+from array import array
+from bisect import bisect_left
 from collections import defaultdict, Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 import time
 
+# Fewest uncached misspellings in a document worth starting worker processes for
+PARALLEL_MIN_WORDS = 100
+
+# Zero-width joiner and non-joiner only affect how a word is rendered, so
+# they are dropped rather than making each variant a separate word
+_NORM_TABLE = str.maketrans({'\u200c': None, '\u200d': None})
+
+
+def normalize_text(text):
+    """Canonical form of Telugu text: NFC without ZWJ/ZWNJ"""
+    return unicodedata.normalize('NFC', text).translate(_NORM_TABLE)
+
+
+# ========== RESULT RECORDS ==========
+# Results are created for every word of every document, so they use
+# __slots__ instead of a per-instance dict
+
+@dataclass
+class Candidate:
+    """
+    A ranked correction candidate for a misspelled word
+    The edit operations are only traced when first asked for: ranking
+    needs the distance alone, and most candidates are never inspected
+    """
+    __slots__ = ('word', 'semantic_score', 'frequency', 'edit_distance',
+                 'combined_score', 'source', '_operations')
+    word: str
+    semantic_score: float
+    frequency: int
+    edit_distance: int
+    combined_score: float
+    source: str  # The misspelled word this candidate corrects
+    
+    def __post_init__(self):
+        self._operations = None
+    
+    @property
+    def operations(self):
+        """Edit operations turning the misspelled word into this candidate"""
+        if self._operations is None:
+            _, self._operations = TeluguSpellChecker._calculate_edit_distance_with_ops(
+                self.source, self.word
+            )
+        return self._operations
+    
+    @property
+    def operation_counts(self):
+        """Number of operations of each type"""
+        counts = Counter(self.operations)
+        return {
+            'INSERTION': counts['INSERTION'],
+            'DELETION': counts['DELETION'],
+            'SUBSTITUTION': counts['SUBSTITUTION'],
+            'TRANSPOSITION': counts['TRANSPOSITION']
+        }
+    
+    def to_dict(self):
+        """Plain dict of the candidate, with its operations, for export"""
+        return {
+            'word': self.word,
+            'semantic_score': self.semantic_score,
+            'frequency': self.frequency,
+            'edit_distance': self.edit_distance,
+            'operations': self.operations,
+            'operation_counts': self.operation_counts,
+            'combined_score': self.combined_score
+        }
+
+
+@dataclass
+class WordResult:
+    """Spell check result for one word of a document"""
+    __slots__ = ('word', 'is_correct', 'candidates')
+    word: str
+    is_correct: bool
+    candidates: list
+    
+    def to_dict(self):
+        """Plain dict of the result, for export"""
+        return {
+            'word': self.word,
+            'is_correct': self.is_correct,
+            'candidates': [candidate.to_dict() for candidate in self.candidates]
+        }
+
+
+# ========== WORKER PROCESSES ==========
+# Workers are forked, so each inherits the parent's checker (vocabulary
+# and sorted word list) without pickling it
+
+_worker_checker = None
+
+
+def _init_worker(checker):
+    """Keep the spell checker inherited by a worker process"""
+    global _worker_checker
+    _worker_checker = checker
+
+
+def _worker_candidates(word):
+    """Rank correction candidates for one word in a worker process"""
+    candidates = _worker_checker.get_correction_candidates(word)
+    sys.stdout.flush()
+    return candidates
+
 
 class TeluguSpellChecker:
     """
@@ -21,15 +137,23 @@ class TeluguSpellChecker:
         """
         self.vocab_file = vocab_file
         
-        # Telugu Unicode pattern (0x0C00 to 0x0C7F)
-        self.telugu_pattern = re.compile(r'[\u0C00-\u0C7F]+')
+        # Telugu Unicode pattern (0x0C00 to 0x0C7F); a ZWNJ/ZWJ between two
+        # Telugu characters stays inside the word it joins
+        self.telugu_pattern = re.compile(r'[\u0C00-\u0C7F]+(?:[\u200C\u200D]+[\u0C00-\u0C7F]+)*')
         
         # === MAIN MEMORY (RAM) ===
         # As per requirement: source document + candidate sets stored here
         self.source_documents = {}        # Document ID → {text, timestamp, results}
         self.misspelled_candidates = {}   # Word → list of candidates (cached in RAM)
-        self.vocabulary = set()           # Fast lookup set
         self.word_freq = {}               # For semantic ranking
+        # Fast lookup: a read-only dict_keys view of word_freq, not a set.
+        # It supports `in` and set operations but has no add(); words are
+        # added through word_freq, and the view is rebound whenever
+        # word_freq is replaced
+        self.vocabulary = self.word_freq.keys()
+        self.alphabet = []                # Characters used by vocabulary words
+        self.max_freq = 1                 # Highest frequency, for normalization
+        self.sorted_vocabulary = None     # Sorted words for the 2-edit search (built on first use)
         
         # === SECONDARY MEMORY (Disk) ===
         # As per requirement: entire spell checker index on disk
@@ -47,7 +171,9 @@ class TeluguSpellChecker:
             'correct_words': 0,
             'misspelled_words': 0,
             'candidates_found': 0,
-            'candidates_not_found': 0
+            'candidates_not_found': 0,
+            'cache_lookups': 0,   # Distinct misspellings looked up by check_document
+            'cache_hits': 0       # ...whose candidates were already cached
         }
         
         # Initialize
@@ -65,14 +191,21 @@ class TeluguSpellChecker:
             self._build_index()
             self._save_to_disk()
         
+        # Substitutions and insertions only need characters that occur in
+        # some vocabulary word; any other character cannot produce a match
+        self.alphabet = sorted(set(''.join(self.vocabulary)))
+        
+        # The frequency table never changes, so its maximum is found once
+        # here instead of on every ranking call
+        self.max_freq = max(self.word_freq.values()) if self.word_freq else 1
+        
         print(f"✅ Ready! Loaded {len(self.vocabulary):,} words")
         
         # Print frequency distribution for verification
         if self.word_freq:
-            max_freq = max(self.word_freq.values())
             min_freq = min(self.word_freq.values())
             avg_freq = sum(self.word_freq.values()) / len(self.word_freq)
-            print(f"   Frequency range: {min_freq} - {max_freq} (avg: {avg_freq:.2f})\n")
+            print(f"   Frequency range: {min_freq} - {self.max_freq} (avg: {avg_freq:.2f})\n")
     
     def _build_index(self):
         """Build vocabulary and frequency index from vocabulary file"""
@@ -80,7 +213,7 @@ class TeluguSpellChecker:
         
         try:
             with open(self.vocab_file, 'r', encoding='utf-8') as f:
-                words = [line.strip() for line in f if line.strip()]
+                words = [word for word in (normalize_text(line).strip() for line in f) if word]
         except FileNotFoundError:
             print(f"   ⚠️  Vocabulary file not found: {self.vocab_file}")
             print(f"   Creating empty vocabulary. Please add words to {self.vocab_file}")
@@ -91,9 +224,13 @@ class TeluguSpellChecker:
         word_counts = Counter(words)
         
         # Add to vocabulary with frequencies
-        for word, freq in word_counts.items():
-            self.vocabulary.add(word)
-            self.word_freq[word] = freq
+        # The vocabulary is a view of the frequency table's keys rather than
+        # a second hash table holding the same ~1M words
+        # Words are kept in sorted order, so the saved index also holds the
+        # word list _search_vocabulary walks; sorting the keys again when it
+        # is first needed is then a single linear pass
+        self.word_freq = {word: word_counts[word] for word in sorted(word_counts)}
+        self.vocabulary = self.word_freq.keys()
         
         print(f"   Built vocabulary: {len(self.vocabulary):,} unique words")
         print(f"   Total word occurrences: {len(words):,}")
@@ -104,10 +241,9 @@ class TeluguSpellChecker:
         print(f"\n💾 Saving complete index to SECONDARY MEMORY...")
         
         index_data = {
-            'vocabulary': self.vocabulary,
             'word_freq': self.word_freq,
             'metadata': {
-                'version': '1.1',  # Updated version
+                'version': '1.5',  # Words are stored in sorted order
                 'total_words': len(self.vocabulary),
                 'total_occurrences': sum(self.word_freq.values()),
                 'created': time.strftime('%Y-%m-%d %H:%M:%S'),
@@ -115,8 +251,9 @@ class TeluguSpellChecker:
             }
         }
         
-        with open(self.index_file, 'wb') as f:
-            pickle.dump(index_data, f)
+        # The pickled index compresses to about a third of its size
+        with gzip.open(self.index_file, 'wb', compresslevel=3) as f:
+            pickle.dump(index_data, f, protocol=pickle.HIGHEST_PROTOCOL)
         
         size_mb = self.index_file.stat().st_size / (1024 * 1024)
         print(f"✅ Saved {size_mb:.2f} MB to disk: {self.index_file}")
@@ -125,12 +262,30 @@ class TeluguSpellChecker:
         """Load index from SECONDARY MEMORY (disk)"""
         start_time = time.time()
         
+        # Indexes saved before version 1.2 are plain, uncompressed pickles
         with open(self.index_file, 'rb') as f:
+            compressed = f.read(2) == b'\x1f\x8b'
+        
+        with (gzip.open if compressed else open)(self.index_file, 'rb') as f:
             index_data = pickle.load(f)
         
-        self.vocabulary = index_data['vocabulary']
+        # Indexes before version 1.3 also store the vocabulary as a set;
+        # it holds the same words as word_freq, so it is not kept
         self.word_freq = index_data['word_freq']
         
+        # Words in indexes before version 1.4 are not normalized; variants
+        # of the same word are merged, and words left empty are dropped as
+        # in _build_index
+        version = index_data.get('metadata', {}).get('version', '1.1')
+        if tuple(map(int, version.split('.'))) < (1, 4):
+            word_freq = Counter()
+            for word, freq in self.word_freq.items():
+                word = normalize_text(word).strip()
+                if word:
+                    word_freq[word] += freq
+            self.word_freq = dict(word_freq)
+        self.vocabulary = self.word_freq.keys()
+        
         elapsed = time.time() - start_time
         
         if 'metadata' in index_data:
@@ -138,7 +293,7 @@ class TeluguSpellChecker:
     
     # ========== 4 EDIT OPERATIONS IMPLEMENTATION (FIXED) ==========
     
-    def _generate_edits_all_operations(self, word):
+    def _iter_edits(self, word):
         """
         FIXED: Generate all possible words using 4 operations with proper implementation
         1. INSERTION - Add one character
@@ -146,148 +301,263 @@ class TeluguSpellChecker:
         3. SUBSTITUTION - Replace one character
         4. TRANSPOSITION - Swap adjacent characters (FIXED to work correctly)
         
+        Edits are yielded one at a time so the caller can test each against
+        the vocabulary as it is made, instead of building lists of ~2k
+        strings that are almost all discarded
+        
         Args:
             word: Telugu word to generate edits for
             
-        Returns:
-            dict: Mapping of operation type to list of edited words
+        Yields:
+            tuple: (operation type, edited word)
         """
-        # Telugu character range (0x0C00 to 0x0C7F)
-        telugu_chars = [chr(i) for i in range(0x0C00, 0x0C7F)]
-        
-        # Split word at all positions
-        splits = [(word[:i], word[i:]) for i in range(len(word) + 1)]
+        # Telugu characters used by the vocabulary
+        telugu_chars = self.alphabet
+        n = len(word)
         
-        edits = {}
+        # Each position's head and tail are sliced once and shared by all
+        # the characters tried there, instead of materializing every split
         
         # 1. DELETION: Remove one character
-        deletes = [L + R[1:] for L, R in splits if R]
-        edits['DELETION'] = [d for d in deletes if d]  # Filter empty strings
+        if n > 1:  # Skip the empty string
+            for i in range(n):
+                yield 'DELETION', word[:i] + word[i+1:]
         
         # 2. TRANSPOSITION: Swap adjacent characters (FIXED)
-        # This was generating incorrect swaps before
-        transposes = []
-        for i in range(len(word) - 1):
+        for i in range(n - 1):
             # Swap characters at position i and i+1
-            transposed = word[:i] + word[i+1] + word[i] + word[i+2:]
-            transposes.append(transposed)
-        edits['TRANSPOSITION'] = transposes
+            yield 'TRANSPOSITION', word[:i] + word[i+1] + word[i] + word[i+2:]
         
         # 3. SUBSTITUTION: Replace one character with another
-        replaces = [L + c + R[1:] for L, R in splits if R for c in telugu_chars]
-        edits['SUBSTITUTION'] = [r for r in replaces if r]
+        for i in range(n):
+            head, tail = word[:i], word[i+1:]
+            for c in telugu_chars:
+                yield 'SUBSTITUTION', head + c + tail
         
         # 4. INSERTION: Add one character
-        inserts = [L + c + R for L, R in splits for c in telugu_chars]
-        edits['INSERTION'] = [i for i in inserts if i]
-        
-        return edits
+        for i in range(n + 1):
+            head, tail = word[:i], word[i:]
+            for c in telugu_chars:
+                yield 'INSERTION', head + c + tail
     
-    def _calculate_edit_distance_with_ops(self, source, target):
+    @staticmethod
+    def _edit_distance_table(source, target):
         """
-        FIXED: Calculate minimum edit distance with proper transposition handling
-        Uses Damerau-Levenshtein distance algorithm
+        Fill the Damerau-Levenshtein DP table for source and target
+        The table is one flat array of C ints instead of a list of lists of
+        boxed floats; cell (i, j) is at dp[i * (len(target) + 1) + j]
         
         Args:
             source: Original (misspelled) word
             target: Candidate correction word
             
         Returns:
-            tuple: (edit_distance, list_of_operations)
+            array: DP table; the distance is its last cell
         """
         m, n = len(source), len(target)
-        
-        # DP table for distances (need extra row/col for transposition)
-        INF = float('inf')
-        dp = [[INF] * (n + 2) for _ in range(m + 2)]
-        
-        # Maximum possible distance
-        max_dist = m + n
-        dp[0][0] = max_dist
+        width = n + 1
+        dp = array('i', [0]) * ((m + 1) * width)
         
         # Initialize first row and column
-        for i in range(1, m + 2):
-            dp[i][0] = max_dist
-            dp[i][1] = i - 1
-        for j in range(1, n + 2):
-            dp[0][j] = max_dist
-            dp[1][j] = j - 1
-        
-        # Track operations
-        operations = []
-        
-        # Dictionary to track last occurrence of each character
-        last_match = {}
+        for j in range(width):
+            dp[j] = j
+        for i in range(1, m + 1):
+            dp[i * width] = i
         
         # Fill DP table with Damerau-Levenshtein algorithm
-        for i in range(2, m + 2):
-            last_match_j = 0
-            for j in range(2, n + 2):
-                last_match_i = last_match.get(target[j-2], 0)
-                cost = 0 if source[i-2] == target[j-2] else 1
+        for i in range(1, m + 1):
+            row = i * width
+            up = row - width
+            s = source[i-1]
+            for j in range(1, width):
+                t = target[j-1]
+                dist = min(dp[up + j] + 1,              # deletion
+                           dp[row + j - 1] + 1,         # insertion
+                           dp[up + j - 1] + (s != t))   # substitution
                 
-                if source[i-2] == target[j-2]:
-                    last_match_j = j - 1
+                # Transposition of two adjacent characters
+                if i > 1 and j > 1 and s == target[j-2] and source[i-2] == t:
+                    dist = min(dist, dp[up - width + j - 2] + 1)
+                dp[row + j] = dist
+        
+        return dp
+    
+    def _edit_distance(self, source, target):
+        """
+        Calculate only the edit distance, without tracing the operations
+        Only the last three rows of the table are kept (a transposition
+        looks two rows back), so memory is O(len(target)) instead of O(mn)
+        
+        Args:
+            source: Original (misspelled) word
+            target: Candidate correction word
+            
+        Returns:
+            int: Damerau-Levenshtein distance (adjacent transpositions)
+        """
+        # Indexing a str creates a new object for every non-Latin-1
+        # character, so the target is split into characters once; the
+        # source is iterated directly
+        target = list(target)
+        n = len(target)
+        
+        # Rows i-2, i-1 and i of the table; the lists are reused in turn
+        prev2 = [0] * (n + 1)
+        prev = list(range(n + 1))
+        curr = [0] * (n + 1)
+        
+        # The neighbouring cells and characters of the current cell are
+        # carried in locals, and min() calls are replaced by comparisons
+        last_s = None
+        for i, s in enumerate(source, 1):
+            curr[0] = left = i
+            diag = prev[0]
+            last_t = None
+            for j in range(1, n + 1):
+                t = target[j-1]
+                if s == t:
+                    # A match is never worse than any of the edits
+                    dist = diag
+                else:
+                    # Cheapest of deletion, insertion and substitution
+                    up = prev[j]
+                    dist = diag if diag < up else up
+                    if left < dist:
+                        dist = left
+                    dist += 1
+                    
+                    # Transposition of two adjacent characters
+                    if s == last_t and last_s == t and prev2[j-2] + 1 < dist:
+                        dist = prev2[j-2] + 1
+                curr[j] = left = dist
+                diag = prev[j]
+                last_t = t
+            prev2, prev, curr = prev, curr, prev2
+            last_s = s
+        
+        return prev[n]
+    
+    def _search_vocabulary(self, word, max_distance):
+        """
+        Find every vocabulary word within max_distance edits of word
+        The sorted vocabulary is walked as a trie: words sharing a prefix
+        form a contiguous range, and each prefix adds one row of the edit
+        distance table. A prefix is abandoned once no word below it can be
+        within max_distance, so only a small part of the vocabulary is
+        visited and no index beyond the sorted word list is needed.
+        
+        Args:
+            word: Misspelled Telugu word
+            max_distance: Largest edit distance to accept
+            
+        Returns:
+            dict: Vocabulary word → its edit distance from word
+        """
+        if self.sorted_vocabulary is None:
+            self.sorted_vocabulary = sorted(self.vocabulary)
+        words = self.sorted_vocabulary
+        
+        chars = list(word)
+        n = len(chars)
+        found = {}
+        
+        # Each entry is a prefix, the range of words starting with it and
+        # the table rows of its parent and of the prefix itself
+        stack = [('', 0, len(words), None, list(range(n + 1)))]
+        while stack:
+            prefix, lo, hi, prev2, prev = stack.pop()
+            depth = len(prefix)
+            
+            # The prefix itself sorts first in its range
+            if depth and words[lo] == prefix:
+                if prev[n] <= max_distance:
+                    found[prefix] = prev[n]
+                lo += 1
+            
+            last_s = prefix[-1] if depth else None
+            while lo < hi:
+                s = words[lo][depth]
+                child = prefix + s
+                end = bisect_left(words, prefix + chr(ord(s) + 1), lo, hi)
                 
-                # Calculate all possible operations
-                deletion = dp[i-1][j] + 1
-                insertion = dp[i][j-1] + 1
-                substitution = dp[i-1][j-1] + cost
-                transposition = dp[last_match_i][last_match_j] + (i - last_match_i - 2) + 1 + (j - last_match_j - 2)
+                # Next row of the table, as in _edit_distance
+                curr = [prev[0] + 1]
+                left = curr[0]
+                diag = prev[0]
+                last_t = None
+                for j in range(1, n + 1):
+                    t = chars[j-1]
+                    if s == t:
+                        dist = diag
+                    else:
+                        up = prev[j]
+                        dist = diag if diag < up else up
+                        if left < dist:
+                            dist = left
+                        dist += 1
+                        if s == last_t and last_s == t and prev2[j-2] + 1 < dist:
+                            dist = prev2[j-2] + 1
+                    curr.append(dist)
+                    left = dist
+                    diag = prev[j]
+                    last_t = t
                 
-                dp[i][j] = min(deletion, insertion, substitution, transposition)
-            
-            last_match[source[i-2]] = i - 1
+                # Rows below can only reuse this row, or the previous one
+                # through a transposition
+                if min(curr) <= max_distance or min(prev) < max_distance:
+                    stack.append((child, lo, end, prev, curr))
+                lo = end
         
-        # Backtrack to find operations (simplified version)
-        distance = dp[m+1][n+1]
+        return found
+    
+    @staticmethod
+    def _calculate_edit_distance_with_ops(source, target):
+        """
+        FIXED: Calculate minimum edit distance with proper transposition handling
+        Uses Damerau-Levenshtein distance algorithm
         
-        # Reconstruct operations
+        Args:
+            source: Original (misspelled) word
+            target: Candidate correction word
+            
+        Returns:
+            tuple: (edit_distance, list_of_operations)
+        """
+        m, n = len(source), len(target)
+        width = n + 1
+        dp = TeluguSpellChecker._edit_distance_table(source, target)
+        distance = dp[m * width + n]
+        
+        # Backtrack from the last cell, following a step that produced
+        # each cell's value
         i, j = m, n
         ops = []
         while i > 0 or j > 0:
-            if i == 0:
-                ops.append('INSERTION')
+            here = dp[i * width + j]
+            if (i > 1 and j > 1 and source[i-1] != target[j-1]
+                    and source[i-1] == target[j-2] and source[i-2] == target[j-1]
+                    and here == dp[(i-2) * width + j - 2] + 1):
+                ops.append('TRANSPOSITION')
+                i -= 2
+                j -= 2
+            elif i > 0 and j > 0 and here == dp[(i-1) * width + j - 1] + (source[i-1] != target[j-1]):
+                if source[i-1] != target[j-1]:
+                    ops.append('SUBSTITUTION')
+                i -= 1
                 j -= 1
-            elif j == 0:
+            elif i > 0 and here == dp[(i-1) * width + j] + 1:
                 ops.append('DELETION')
                 i -= 1
-            elif source[i-1] == target[j-1]:
-                i -= 1
-                j -= 1
             else:
-                # Check which operation was used
-                costs = []
-                if i > 0 and j > 0:
-                    costs.append(('SUBSTITUTION', dp[i][j]))
-                if i > 0:
-                    costs.append(('DELETION', dp[i][j]))
-                if j > 0:
-                    costs.append(('INSERTION', dp[i][j]))
-                if i > 1 and j > 1 and source[i-1] == target[j-2] and source[i-2] == target[j-1]:
-                    costs.append(('TRANSPOSITION', dp[i][j]))
-                    ops.append('TRANSPOSITION')
-                    i -= 2
-                    j -= 2
-                    continue
-                
-                # Find minimum cost operation
-                min_cost = min(costs, key=lambda x: x[1])[0]
-                ops.append(min_cost)
-                
-                if min_cost == 'SUBSTITUTION':
-                    i -= 1
-                    j -= 1
-                elif min_cost == 'DELETION':
-                    i -= 1
-                else:  # INSERTION
-                    j -= 1
+                ops.append('INSERTION')
+                j -= 1
         
         return distance, list(reversed(ops))
     
     # ========== SEMANTIC RANKING (FIXED) ==========
     
-    def _rank_candidates_semantic(self, misspelled_word, candidates):
+    def _rank_candidates_semantic(self, misspelled_word, candidates, max_candidates=None,
+                                  distance=None):
         """
         FIXED: Rank candidates with proper frequency weighting
         Now produces diverse scores based on actual word frequencies
@@ -300,35 +570,33 @@ class TeluguSpellChecker:
         Args:
             misspelled_word: The incorrect word
             candidates: Set of candidate corrections
+            max_candidates: Number of top candidates to return (all if None)
+            distance: Edit distance shared by all candidates, if already known
             
         Returns:
-            list: Ranked list of candidates with diverse scores
+            list: Ranked list of Candidate records with diverse scores
         """
-        ranked = []
+        scored = []
+        get_freq = self.word_freq.get
+        edit_distance = self._edit_distance
         
-        # Get max frequency for normalization
-        max_freq = max(self.word_freq.values()) if self.word_freq else 1
+        # Max frequency for normalization (cached when the index is loaded)
+        max_freq = self.max_freq
         
         for candidate in candidates:
             # FIXED: Better frequency scoring
-            freq = self.word_freq.get(candidate, 1)
+            freq = get_freq(candidate, 1)
             
             # Use log scale but with better differentiation
             # Higher frequency words get significantly higher scores
             semantic_score = math.log(freq + 1) * (freq / max_freq)
             
-            # Calculate edit distance and track operations
-            edit_dist, operations = self._calculate_edit_distance_with_ops(
-                misspelled_word, candidate
-            )
-            
-            # Count each operation type
-            op_counts = {
-                'INSERTION': operations.count('INSERTION'),
-                'DELETION': operations.count('DELETION'),
-                'SUBSTITUTION': operations.count('SUBSTITUTION'),
-                'TRANSPOSITION': operations.count('TRANSPOSITION')
-            }
+            # Only the distance is needed for ranking; operations are traced
+            # later, for the returned candidates that are inspected
+            if distance is None:
+                edit_dist = edit_distance(misspelled_word, candidate)
+            else:
+                edit_dist = distance
             
             # FIXED: Better combined score calculation
             # Length similarity bonus
@@ -341,18 +609,31 @@ class TeluguSpellChecker:
             # Combined score: frequency boost - edit penalty - length penalty
             combined_score = (semantic_score * 100) - edit_penalty - length_penalty
             
-            ranked.append({
-                'word': candidate,
-                'semantic_score': semantic_score,
-                'frequency': freq,
-                'edit_distance': edit_dist,
-                'operations': operations,
-                'operation_counts': op_counts,
-                'combined_score': combined_score
-            })
-        
-        # Sort by combined score (descending)
-        ranked.sort(key=lambda x: (-x['combined_score'], x['edit_distance'], -x['frequency']))
+            # Scores are kept as plain tuples; Candidate records are only
+            # built for the candidates that are returned
+            scored.append((-combined_score, edit_dist, -freq, candidate, semantic_score))
+        
+        # Sort by combined score (descending), then distance and frequency;
+        # candidate words are distinct, so remaining ties are broken by the
+        # word itself and the order does not depend on set iteration
+        # Only the top max_candidates are needed, so a heap selects them
+        # instead of sorting every candidate
+        if max_candidates is None:
+            top = sorted(scored)
+        else:
+            top = heapq.nsmallest(max_candidates, scored)
+        
+        # Operations are traced by each Candidate when first used
+        ranked = []
+        for neg_score, edit_dist, neg_freq, candidate, semantic_score in top:
+            ranked.append(Candidate(
+                word=candidate,
+                semantic_score=semantic_score,
+                frequency=-neg_freq,
+                edit_distance=edit_dist,
+                combined_score=-neg_score,
+                source=misspelled_word
+            ))
         
         return ranked
     
@@ -368,60 +649,88 @@ class TeluguSpellChecker:
             max_candidates: Maximum number of candidates to return
             
         Returns:
-            list: Top-ranked candidates with scores
+            list: Top-ranked Candidate records with scores
         """
+        vocabulary = self.vocabulary
+        cache = self.misspelled_candidates
+        
         # Check if word is already correct
-        if word in self.vocabulary:
+        if word in vocabulary:
             return []
         
         # Check if candidates already computed (cached in MAIN MEMORY)
-        if word in self.misspelled_candidates:
-            return self.misspelled_candidates[word]
-        
-        # Generate all 1-edit candidates using 4 operations
-        all_edits = self._generate_edits_all_operations(word)
+        if word in cache:
+            return cache[word]
         
-        # Collect valid candidates (exist in vocabulary)
+        # Collect valid 1-edit candidates (exist in vocabulary)
+        # The word itself is not in the vocabulary, so each of them is at
+        # distance exactly 1 and needs no DP while ranking
         candidates = set()
+        distance = 1
         op_tracking = {}  # Track which operation generated each candidate
         
-        for op_type, edit_list in all_edits.items():
-            for edited_word in edit_list:
-                if edited_word in self.vocabulary:
-                    candidates.add(edited_word)
-                    if edited_word not in op_tracking:
-                        op_tracking[edited_word] = op_type
+        for op_type, edited_word in self._iter_edits(word):
+            if edited_word in vocabulary:
+                candidates.add(edited_word)
+                op_tracking.setdefault(edited_word, op_type)
         
         # If no 1-edit candidates found, try 2-edit distance
+        # Nothing is within one edit, so every word found is exactly 2 away
         if not candidates:
             print(f"   ⚠️  No 1-edit candidates for '{word}', trying 2-edit distance...")
-            
-            # Generate 2-edit candidates (nested operations)
-            for first_edit in sum(all_edits.values(), []):
-                if len(candidates) >= 50:  # Limit for performance
-                    break
-                
-                second_edits = self._generate_edits_all_operations(first_edit)
-                for edit_list in second_edits.values():
-                    for edited_word in edit_list:
-                        if edited_word in self.vocabulary:
-                            candidates.add(edited_word)
-                            if len(candidates) >= 50:
-                                break
+            distance = 2
+            candidates = set(self._search_vocabulary(word, distance))
         
         if not candidates:
             print(f"   ❌ No candidates found for '{word}' (not in vocabulary)")
         
         # Rank candidates by semantic score
-        ranked = self._rank_candidates_semantic(word, candidates)
+        ranked = self._rank_candidates_semantic(word, candidates, max_candidates, distance)
         
         # Store in MAIN MEMORY (as per requirement)
-        self.misspelled_candidates[word] = ranked[:max_candidates]
+        cache[word] = ranked
         
-        return self.misspelled_candidates[word]
+        return ranked
     
     # ========== DOCUMENT PROCESSING ==========
     
+    def _generate_candidates_parallel(self, words):
+        """
+        Compute candidates for many misspelled words in worker processes
+        Words are independent once the index is loaded, so uncached ones
+        are split across forked workers and their ranked candidates are
+        stored in the MAIN MEMORY cache. Small batches, single-core
+        machines and platforms without fork are left to the caller.
+        
+        Args:
+            words: Distinct misspelled words
+        """
+        cache = self.misspelled_candidates
+        pending = [word for word in words if word not in cache]
+        workers = os.cpu_count() or 1
+        if (len(pending) < PARALLEL_MIN_WORDS or workers < 2
+                or 'fork' not in multiprocessing.get_all_start_methods()):
+            return
+        
+        # Build the sorted word list once here rather than in every worker,
+        # and flush pending output so the workers do not repeat it
+        if self.sorted_vocabulary is None:
+            self.sorted_vocabulary = sorted(self.vocabulary)
+        sys.stdout.flush()
+        
+        # Workers share the parent's memory pages until they write to them.
+        # Freezing moves the index out of the collector's reach, so garbage
+        # collection in a worker does not copy the pages of every word
+        gc.freeze()
+        try:
+            context = multiprocessing.get_context('fork')
+            with ProcessPoolExecutor(workers, context, _init_worker, (self,)) as executor:
+                ranked = executor.map(_worker_candidates, pending,
+                                      chunksize=max(1, len(pending) // (workers * 4)))
+                cache.update(zip(pending, ranked))
+        finally:
+            gc.unfreeze()
+    
     def check_document(self, document_id, text):
         """
         Check entire document and store in MAIN MEMORY
@@ -432,7 +741,7 @@ class TeluguSpellChecker:
             text: Telugu text to check
             
         Returns:
-            list: Results for each word in document
+            list: WordResult for each word in document
         """
         # Store source document in MAIN MEMORY
         self.source_documents[document_id] = {
@@ -443,51 +752,68 @@ class TeluguSpellChecker:
             'results': []
         }
         
-        # Extract Telugu words
-        words = self.telugu_pattern.findall(text)
+        # Extract Telugu words, in the same normalized form as the vocabulary;
+        # the stored text is left as given
+        raw_words = self.telugu_pattern.findall(text)
+        normalized = {word: normalize_text(word) for word in set(raw_words)}
+        words = [normalized[word] for word in raw_words]
         self.source_documents[document_id]['word_count'] = len(words)
         
-        results = []
-        misspelled_count = 0
-        
-        for word in words:
-            self.stats['words_checked'] += 1
+        # Most words are spelled correctly: one set difference over the
+        # distinct words finds the misspelled ones, and candidates are
+        # looked up once per distinct misspelling (in document order)
+        word_counts = Counter(words)
+        misspelled_words = set(word_counts) - self.vocabulary
+        misspelled_unique = [word for word in word_counts if word in misspelled_words]
+        cache = self.misspelled_candidates
+        cache_hits = sum(1 for word in misspelled_unique if word in cache)
+        self._generate_candidates_parallel(misspelled_unique)
+        
+        get_cands = self.get_correction_candidates
+        candidates_for = {word: get_cands(word) for word in misspelled_unique}
+        
+        # Counters are kept in local ints and written to self.stats once
+        misspelled_count = found = not_found = 0
+        insertions = deletions = substitutions = transpositions = 0
+        for word, candidates in candidates_for.items():
+            count = word_counts[word]
+            misspelled_count += count
             
-            if word in self.vocabulary:
-                self.stats['correct_words'] += 1
-                results.append({
-                    'word': word,
-                    'is_correct': True,
-                    'candidates': []
-                })
-            else:
-                misspelled_count += 1
-                self.stats['misspelled_words'] += 1
-                candidates = self.get_correction_candidates(word)
-                
-                if candidates:
-                    self.stats['candidates_found'] += 1
-                else:
-                    self.stats['candidates_not_found'] += 1
-                
-                results.append({
-                    'word': word,
-                    'is_correct': False,
-                    'candidates': candidates
-                })
+            if candidates:
+                found += count
                 
                 # Update operation statistics
-                if candidates:
-                    self.stats['total_corrections'] += 1
-                    top_candidate = candidates[0]
-                    self.stats['insertion_ops'] += top_candidate['operation_counts']['INSERTION']
-                    self.stats['deletion_ops'] += top_candidate['operation_counts']['DELETION']
-                    self.stats['substitution_ops'] += top_candidate['operation_counts']['SUBSTITUTION']
-                    self.stats['transposition_ops'] += top_candidate['operation_counts']['TRANSPOSITION']
+                op_counts = candidates[0].operation_counts
+                insertions += op_counts['INSERTION'] * count
+                deletions += op_counts['DELETION'] * count
+                substitutions += op_counts['SUBSTITUTION'] * count
+                transpositions += op_counts['TRANSPOSITION'] * count
+            else:
+                not_found += count
+        
+        stats = self.stats
+        stats['candidates_found'] += found
+        stats['candidates_not_found'] += not_found
+        stats['total_corrections'] += found
+        stats['insertion_ops'] += insertions
+        stats['deletion_ops'] += deletions
+        stats['substitution_ops'] += substitutions
+        stats['transposition_ops'] += transpositions
+        stats['words_checked'] += len(words)
+        stats['correct_words'] += len(words) - misspelled_count
+        stats['misspelled_words'] += misspelled_count
+        stats['cache_lookups'] += len(misspelled_unique)
+        stats['cache_hits'] += cache_hits
+        
+        results = [
+            WordResult(word, False, candidates_for[word]) if word in candidates_for
+            else WordResult(word, True, [])
+            for word in words
+        ]
         
         self.source_documents[document_id]['misspelled_count'] = misspelled_count
         self.source_documents[document_id]['results'] = results
-        self.stats['documents_processed'] += 1
+        stats['documents_processed'] += 1
         
         return results
     
@@ -505,17 +831,22 @@ class TeluguSpellChecker:
             raise ValueError(f"Document '{document_id}' not found in main memory")
         
         original_text = self.source_documents[document_id]['text']
-        corrected_text = original_text
         results = self.source_documents[document_id]['results']
         
-        # Apply corrections
-        for result in results:
-            if not result['is_correct'] and result['candidates']:
-                original_word = result['word']
-                correction = result['candidates'][0]['word']
-                corrected_text = corrected_text.replace(original_word, correction, 1)
+        # Top-ranked correction for each misspelled word
+        corrections = {
+            result.word: result.candidates[0].word
+            for result in results
+            if not result.is_correct and result.candidates
+        }
         
-        return corrected_text
+        # Apply corrections in one pass over the Telugu words of the text,
+        # so a misspelling is never replaced inside a longer word; words are
+        # matched in normalized form, and every other span is kept as given
+        return self.telugu_pattern.sub(
+            lambda match: corrections.get(normalize_text(match.group()), match.group()),
+            original_text
+        )
     
     # ========== UTILITY METHODS ==========
     
@@ -530,6 +861,8 @@ class TeluguSpellChecker:
         total_chars = sum(len(doc['text']) for doc in self.source_documents.values())
         print(f"   Total characters in memory: {total_chars:,}")
         print(f"   Cached candidate sets: {len(self.misspelled_candidates)} words")
+        print(f"   Candidate cache hits: {self.stats['cache_hits']} of "
+              f"{self.stats['cache_lookups']} lookups")
         
         print("\n🔵 SECONDARY MEMORY (Disk):")
         if self.index_file.exists():
@@ -622,7 +955,7 @@ class TeluguSpellChecker:
             'original_text': doc['text'],
             'corrected_text': self.correct_document(document_id),
             'statistics': self.get_document_summary(document_id),
-            'detailed_results': doc['results']
+            'detailed_results': [result.to_dict() for result in doc['results']]
         }
         
         with open(output_file, 'w', encoding='utf-8') as f:
@@ -1,5 +1,4 @@
 from telugu_spellchecker import TeluguSpellChecker, create_spell_checker
-import time
 import sys
 from datetime import datetime
 
@@ -8,17 +7,30 @@ class DualOutput:
     """Class to write output to both console and file simultaneously"""
     def __init__(self, filename):
         self.terminal = sys.stdout
-        self.log_file = open(filename, 'w', encoding='utf-8')
+        self.log_file = open(filename, 'w', encoding='utf-8', buffering=65536)
+        # print() writes its text, separator and line end separately; the
+        # pieces are passed on to both outputs a whole line at a time
+        self.pending = []
     
     def write(self, message):
-        self.terminal.write(message)
-        self.log_file.write(message)
+        self.pending.append(message)
+        if '\n' in message:
+            self._write_pending()
+    
+    def _write_pending(self):
+        text = ''.join(self.pending)
+        self.pending = []
+        self.terminal.write(text)
+        self.log_file.write(text)
     
     def flush(self):
+        if self.pending:
+            self._write_pending()
         self.terminal.flush()
         self.log_file.flush()
     
     def close(self):
+        self.flush()
         self.log_file.close()
 
 
@@ -36,17 +48,30 @@ def print_test_header(test_num, test_name):
     print("="*70)
 
 
+# Candidate details are formatted as one block and printed with one call
+CANDIDATE_TEMPLATE = (
+    "\n   Rank {rank}: {word}\n"
+    "   {rule}\n"
+    "    Word Frequency:    {frequency}\n"
+    "    Edit Distance:     {edit_distance}\n"
+    "    Operations Used:   {operations}\n"
+    "    Operation Breakdown:"
+)
+
+
 def print_candidate_details(rank, candidate):
     """Print detailed candidate information"""
-    print(f"\n   Rank {rank}: {candidate['word']}")
-    print(f"   {'─'*65}")
-    print(f"    Word Frequency:    {candidate['frequency']}")
-    print(f"    Edit Distance:     {candidate['edit_distance']}")
-    print(f"    Operations Used:   {' → '.join(candidate['operations']) if candidate['operations'] else 'None'}")
-    print(f"    Operation Breakdown:")
-    for op, count in candidate['operation_counts'].items():
-        if count > 0:
-            print(f"      • {op}: {count}")
+    lines = [CANDIDATE_TEMPLATE.format(
+        rank=rank,
+        word=candidate.word,
+        rule='─' * 65,
+        frequency=candidate.frequency,
+        edit_distance=candidate.edit_distance,
+        operations=' → '.join(candidate.operations) or 'None'
+    )]
+    lines += [f"      • {op}: {count}"
+              for op, count in candidate.operation_counts.items() if count > 0]
+    print('\n'.join(lines))
 
 
 def run_test_case_1(checker):
@@ -61,7 +86,7 @@ def run_test_case_1(checker):
     
     results = checker.check_document('test_1', test_text)
     
-    misspelled = [r for r in results if not r['is_correct']]
+    misspelled = [r for r in results if not r.is_correct]
     
     if not misspelled:
         print("  Note: All words found in vocabulary (possible data leakage)")
@@ -70,11 +95,11 @@ def run_test_case_1(checker):
         print(f" Found {len(misspelled)} misspelled word(s):\n")
         
         for i, result in enumerate(misspelled, 1):
-            print(f"{i}. Misspelled: '{result['word']}'")
+            print(f"{i}. Misspelled: '{result.word}'")
             print(f"   Candidates (Ranked by Semantic Importance):")
             
-            if result['candidates']:
-                for rank, candidate in enumerate(result['candidates'][:3], 1):  # Show top 3
+            if result.candidates:
+                for rank, candidate in enumerate(result.candidates[:3], 1):  # Show top 3
                     print_candidate_details(rank, candidate)
             else:
                 print("    No candidates found (word too different from vocabulary)")
@@ -99,7 +124,7 @@ def run_test_case_2(checker):
     
     results = checker.check_document('test_2', test_text)
     
-    misspelled = [r for r in results if not r['is_correct']]
+    misspelled = [r for r in results if not r.is_correct]
     
     if not misspelled:
         print("  No spelling errors found in vocabulary")
@@ -107,11 +132,11 @@ def run_test_case_2(checker):
         print(f" Found {len(misspelled)} misspelled word(s):\n")
         
         for i, result in enumerate(misspelled, 1):
-            print(f"{i}. Misspelled: '{result['word']}'")
+            print(f"{i}. Misspelled: '{result.word}'")
             print(f"   Candidates (Ranked by Semantic Importance):")
             
-            if result['candidates']:
-                for rank, candidate in enumerate(result['candidates'][:3], 1):
+            if result.candidates:
+                for rank, candidate in enumerate(result.candidates[:3], 1):
                     print_candidate_details(rank, candidate)
             else:
                 print("    No candidates found")
@@ -136,7 +161,7 @@ def run_test_case_3(checker):
     
     results = checker.check_document('test_3', test_text)
     
-    misspelled = [r for r in results if not r['is_correct']]
+    misspelled = [r for r in results if not r.is_correct]
     
     if not misspelled:
         print("  No spelling errors found")
@@ -144,11 +169,11 @@ def run_test_case_3(checker):
         print(f"Found {len(misspelled)} misspelled word(s):\n")
         
         for i, result in enumerate(misspelled, 1):
-            print(f"{i}. Misspelled: '{result['word']}'")
+            print(f"{i}. Misspelled: '{result.word}'")
             print(f"   Candidates (Ranked by Semantic Importance):")
             
-            if result['candidates']:
-                for rank, candidate in enumerate(result['candidates'][:3], 1):
+            if result.candidates:
+                for rank, candidate in enumerate(result.candidates[:3], 1):
                     print_candidate_details(rank, candidate)
             else:
                 print("    No candidates found")
@@ -174,7 +199,7 @@ def run_test_case_4(checker):
     
     results = checker.check_document('test_4', test_text)
     
-    misspelled = [r for r in results if not r['is_correct']]
+    misspelled = [r for r in results if not r.is_correct]
     
     if not misspelled:
         print("  No spelling errors found")
@@ -182,15 +207,15 @@ def run_test_case_4(checker):
         print(f" Found {len(misspelled)} misspelled word(s):\n")
         
         for i, result in enumerate(misspelled, 1):
-            print(f"{i}. Misspelled: '{result['word']}'")
+            print(f"{i}. Misspelled: '{result.word}'")
             print(f"   Candidates (Ranked by Semantic Importance):")
             
-            if result['candidates']:
-                for rank, candidate in enumerate(result['candidates'][:3], 1):
+            if result.candidates:
+                for rank, candidate in enumerate(result.candidates[:3], 1):
                     print_candidate_details(rank, candidate)
                     
                 # VERIFICATION: Check if transposition was detected
-                if any(c['operation_counts']['TRANSPOSITION'] > 0 for c in result['candidates']):
+                if any(c.operation_counts['TRANSPOSITION'] > 0 for c in result.candidates):
                     print("   ✅ TRANSPOSITION operation detected successfully!")
                 else:
                     print("    Note: TRANSPOSITION not detected (using other operations)")
@@ -217,7 +242,7 @@ def run_test_case_5(checker):
     
     results = checker.check_document('test_5', test_text)
     
-    misspelled = [r for r in results if not r['is_correct']]
+    misspelled = [r for r in results if not r.is_correct]
     
     if not misspelled:
         print("  No spelling errors found")
@@ -225,11 +250,11 @@ def run_test_case_5(checker):
         print(f" Found {len(misspelled)} misspelled word(s):\n")
         
         for i, result in enumerate(misspelled, 1):
-            print(f"{i}. Misspelled: '{result['word']}'")
+            print(f"{i}. Misspelled: '{result.word}'")
             print(f"   Candidates (Ranked by Semantic Importance):")
             
-            if result['candidates']:
-                for rank, candidate in enumerate(result['candidates'][:3], 1):
+            if result.candidates:
+                for rank, candidate in enumerate(result.candidates[:3], 1):
                     print_candidate_details(rank, candidate)
             else:
                 print("    No candidates found")
@@ -280,6 +305,10 @@ def demonstrate_auto_correction(checker):
         if summary:
             print(f"Accuracy:  {summary['accuracy']:.1f}%")
             print(f"Errors:    {summary['misspelled_count']}/{summary['word_count']}")
+    
+    # Misspellings seen in the earlier test cases reuse their cached candidates
+    print(f"\nCandidate cache hits: {checker.stats['cache_hits']} of "
+          f"{checker.stats['cache_lookups']} lookups")
 
 
 def demonstrate_export_feature(checker):
@@ -315,40 +344,29 @@ def run_all_tests():
     sys.stdout = dual_output
     
     try:
-        
-        time.sleep(1)
-        
         # Initialize spell checker
         print_section_header("INITIALIZATION")
         checker = create_spell_checker()
         
         # Run test cases
         run_test_case_1(checker)
-        time.sleep(0.5)
         
         run_test_case_2(checker)
-        time.sleep(0.5)
         
         run_test_case_3(checker)
-        time.sleep(0.5)
         
         run_test_case_4(checker)
-        time.sleep(0.5)
         
         run_test_case_5(checker)
-        time.sleep(0.5)
         
         # Memory architecture demonstration
         demonstrate_memory_architecture(checker)
-        time.sleep(0.5)
         
         # Auto-correction demonstration
         demonstrate_auto_correction(checker)
-        time.sleep(0.5)
         
         # Export feature demonstration
         demonstrate_export_feature(checker)
-        time.sleep(0.5)
         
     finally:
         # Restore original stdout and close log file
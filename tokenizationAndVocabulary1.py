@@ -1,33 +1,84 @@
 import re
-import json  # for saving tokenized sentences
+from json.encoder import encode_basestring  # for saving tokenized sentences
 
-# Read the cleaned Telugu data
-with open("final_cleaned_telugu_data_1.txt", "r", encoding="utf-8") as f:
-    text = f.read()
+# Chunk size for streaming the cleaned data (1 MiB of text)
+CHUNK_SIZE = 1 << 20
 
-# Split into sentences
-sentences = [s.strip() for s in text.split('.') if s.strip()]
+# Telugu words: runs of characters in the Telugu Unicode block (U+0C00-U+0C7F)
+TOKEN_RE = re.compile(r'[\u0C00-\u0C7F]+')
 
-# Tokenize sentences into words
-tokenized_sentences = [re.findall(r'[\u0C00-\u0C7F]+', s) for s in sentences]
+# Sentence terminators: full stop, '!', '?' and the danda and double danda
+# (U+0964, U+0965) used in Indic text
+SENTENCE_END_RE = re.compile(r'[.!?\u0964\u0965]')
 
-# Build vocabulary
-vocabulary = set(word for sent in tokenized_sentences for word in sent)
 
-# Save sentences to a text file (one sentence per line)
-with open("telugu_sentences_1.txt", "w", encoding="utf-8") as f:
-    for sentence in sentences:
-        f.write(sentence + "\n")
+def iter_sentences(file, chunk_size=CHUNK_SIZE):
+    """
+    Yields the stripped, non-empty sentences of a text file, split at any
+    SENTENCE_END_RE terminator.
+    The file is read chunk by chunk; a sentence that is not finished at the
+    end of a chunk carries over into the next one.
+    """
+    pending = []
+    for chunk in iter(lambda: file.read(chunk_size), ''):
+        *sentences, tail = SENTENCE_END_RE.split(chunk)
+        if sentences:
+            sentences[0] = ''.join(pending) + sentences[0]
+            pending = []
+            for sentence in sentences:
+                sentence = sentence.strip()
+                if sentence:
+                    yield sentence
+        pending.append(tail)
+    sentence = ''.join(pending).strip()
+    if sentence:
+        yield sentence
 
-# Save tokenized sentences as JSON
-with open("telugu_tokenized_sentences_1.json", "w", encoding="utf-8") as f:
-    json.dump(tokenized_sentences, f, ensure_ascii=False, indent=2)
+
+def format_tokens(tokens):
+    """
+    Formats one sentence's tokens as an element of the JSON array, laid out
+    as json.dump(..., indent=2) lays out the whole list. Each token is
+    escaped by the json module's C string encoder; json.dumps with indent
+    would run its pure-Python encoder instead.
+    """
+    if not tokens:
+        return "[]"
+    return "[\n    " + ",\n    ".join(map(encode_basestring, tokens)) + "\n  ]"
+
+
+# Read the cleaned Telugu data one sentence at a time, writing each
+# sentence and its tokens out as soon as it is read
+vocabulary = set()
+sentence_count = 0
+with open("final_cleaned_telugu_data_1.txt", "r", encoding="utf-8") as f, \
+        open("telugu_sentences_1.txt", "w", encoding="utf-8") as sentences_out, \
+        open("telugu_tokenized_sentences_1.json", "w", encoding="utf-8") as json_out:
+    # The JSON array is written element by element
+    separator = "[\n  "
+    for sentence in iter_sentences(f):
+        # Save sentence to a text file (one sentence per line)
+        sentences_out.write(sentence + "\n")
+
+        # Tokenize sentence into words
+        tokens = TOKEN_RE.findall(sentence)
+        json_out.write(separator + format_tokens(tokens))
+        separator = ",\n  "
+
+        # Build vocabulary
+        vocabulary.update(tokens)
+        sentence_count += 1
+    json_out.write("\n]" if sentence_count else "[]")
 
 # Save vocabulary as text file (one word per line)
+# UTF-8 preserves code point order, so sorting the encoded words gives the
+# same order while comparing with plain byte comparisons
+# The sorted words are joined and written with a single call
+words = sorted(vocabulary, key=str.encode)
 with open("telugu_vocabulary_1.txt", "w", encoding="utf-8") as f:
-    for word in sorted(vocabulary):
-        f.write(word + "\n")
+    if words:
+        f.write("\n".join(words) + "\n")
 
-print(f"Saved {len(sentences)} sentences to 'telugu_sentences_1.txt'")
+print(f"Saved {sentence_count} sentences to 'telugu_sentences_1.txt'")
 print(f"Saved tokenized sentences to 'telugu_tokenized_sentences_1.json'")
 print(f"Saved {len(vocabulary)} unique words to 'telugu_vocabulary_1.txt'")